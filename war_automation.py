@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
 """ 
     Selenium Automation Script for entering information into AWS WAR (Well-Architected Review) Portal
@@ -7,6 +7,10 @@
         Input configuration file path: <script_dir>/war_input.ini
         Output directory path: <script_dir>/<customer_name_dir>/
 
+    Environment variables (optional, asked interactively when not set):
+        WAR_USERNAME - AWS Console username
+        WAR_PASSWORD - AWS Console password
+
     Exit codes and their descriptions:
         0 - Normal termination
         1 - Selenium is not installed
@@ -20,77 +24,86 @@
 """
 
 import os, sys
-import time, datetime, random
+import time, random
 import logging
 import argparse
 import getpass
-from subprocess import Popen, PIPE
-try:
-    from selenium import webdriver
-    from selenium.webdriver.support.ui import WebDriverWait, Select
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver import ActionChains
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-except ModuleNotFoundError:
-    print('Selenium is not installed.\n\nFor installation run the following command: ' + \
-          'pip install selenium\nFor more details visit: https://pypi.org/project/selenium/')
-    exit(1)
-except Exception as err:
-    print(str(err))
-    exit(1)
+import shutil
+import atexit
+import configparser
+from concurrent.futures import ThreadPoolExecutor
 
 script_version = "1.0" 
 args = None
-
-def get_python_version():
-    major_version = str(sys.version_info[0])
-    minor_version = str(sys.version_info[1])
-    python_version = float(major_version + '.' + minor_version)
-    return python_version
-
-if 3 <= get_python_version():
-    import configparser
-else:
-    import ConfigParser as configparser
+# Configured in main(): without --debug only warnings and errors pass and they are discarded
+logger = logging.getLogger('war_automation')
+logger.addHandler(logging.NullHandler())
+# Expected conditions for the element states of get_element/get_elements, filled in import_selenium()
+element_conditions = {}
+elements_conditions = {}
+
+def import_selenium():
+    # Selenium is imported only when the automation is about to run, so e.g. --help and --version exit quickly
+    global webdriver, WebDriverWait, Select, By, EC, Keys, ActionChains, \
+        TimeoutException, NoSuchElementException, StaleElementReferenceException
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.support.ui import WebDriverWait, Select
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver import ActionChains
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException, \
+            StaleElementReferenceException
+        element_conditions.update({'presence' : EC.presence_of_element_located,
+                                   'visibility' : EC.visibility_of_element_located,
+                                   'clickable' : EC.element_to_be_clickable,
+                                   'invisibility' : EC.invisibility_of_element_located})
+        elements_conditions.update({'presence' : EC.presence_of_all_elements_located,
+                                    'visibility' : EC.visibility_of_all_elements_located})
+    except ModuleNotFoundError:
+        print('Selenium is not installed.\n\nFor installation run the following command: ' + \
+              'pip install selenium\nFor more details visit: https://pypi.org/project/selenium/')
+        exit(1)
+    except Exception as err:
+        print(str(err))
+        exit(1)
 
 def logging_setup(log_file_path):
     logging.basicConfig(filename = log_file_path, format = '%(asctime)s %(message)s', 
                         level=logging.DEBUG)
-
-def run_command(command_str):
+    # Info messages are printed as well
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.addFilter(lambda record: logging.INFO == record.levelno)
+    logger.addHandler(console_handler)
+
+def has_selenium_manager():
+    # Selenium 4.6 and later finds or downloads a matching driver itself when it is not in PATH
+    import selenium
     try:
-        process = Popen(command_str.split(), stdout = PIPE, stderr = PIPE)
-        stdout, stderr = process.communicate()
-        exit_code = process.wait()
-        if args.debug:
-            logging.info(stdout)
-            print(stdout.decode())
-    except Exception as err:
-        if args.debug:
-            logging.exception(err)
-        print(str(err))
-    finally:
-        return exit_code, stdout, stderr
+        version = tuple(int(part) for part in selenium.__version__.split('.')[:2])
+    except ValueError:
+        return False
+    return (4, 6) <= version
 
 def check_chrome_driver_existence():
     if 'nt' == os.name:
         driver_name = 'chromedriver.exe'
-        command_str = 'where ' + driver_name
     else:
         driver_name = 'chromedriver'
-        command_str = 'which ' + driver_name
-    exit_code, stdout, stderr = run_command(command_str)
-    if 0 != exit_code:
-        if args.debug:
-            logging.error(stderr)
+    driver_path = shutil.which(driver_name)
+    if driver_path is None:
+        if has_selenium_manager():
+            logger.info(driver_name + ' is not found in PATH, it will be provided by Selenium Manager')
+            return
+        logger.error(driver_name + ' is not found in PATH')
         error_message = 'Selenium driver (' + driver_name + ') for Chrome browser is not found\n\n' + \
             'If it exists on the system make sure its path is included in PATH ' + \
             'environment variable.\nOtherwise it can be downloaded from the ' + \
             'following page:\nhttps://sites.google.com/a/chromium.org/chromedriver/downloads'
         print(error_message)
         exit(2)
+    logger.info('Chrome Driver Path: ' + driver_path)
 
 def setup_input_args(script_dir):
     global args
@@ -108,190 +121,310 @@ def setup_input_args(script_dir):
                         help='run Chrome browser in headless (Non-GUI) mode')
     parser.add_argument('-d', '--debug', action='store_true', help='print debug/info messages and create debug log')
     parser.add_argument('-s', '--slow', dest='run_slowly', action='store_true', 
-                        help='run the script with up to 1 second random delays between some calls')
+                        help='type the sign-in credentials in short chunks with up to 0.1 second random delays')
+    existing_pdf_group = parser.add_mutually_exclusive_group()
+    existing_pdf_group.add_argument('--overwrite', action='store_true', 
+                                    help='overwrite the existing PDF file of the workload without asking')
+    existing_pdf_group.add_argument('--skip-existing', dest='skip_existing', action='store_true', 
+                                    help='exit without asking when the PDF file of the workload already exists')
+    parser.add_argument('-p', '--profile-dir', dest='profile_dir', 
+                        help='Chrome user data directory to reuse between runs, the AWS Console session is kept\n' + \
+                             'signed in there (the directory must not be in use by another Chrome instance)')
     parser.add_argument('-v', '--version', action='version', 
                         version='Script Version: ' + script_version + '.', 
                         help='print script version information and exit')
     args = parser.parse_args()
 
 def make_directory(dir_path):
-    if not os.path.isdir(dir_path):
-        if 'nt' == os.name and os.path.isfile(dir_path):
-            print('Error: A file with name \'log\' exists.')
-            print('Could not create log directory.')
-            exit(3)
-        try:
-            os.makedirs(dir_path)
-        except OSError as err:
-            if args.debug:
-                logging.exception(err)
-            print(str(err))
-            exit(3)
+    try:
+        os.makedirs(dir_path, exist_ok = True)
+    except FileExistsError as err:
+        # A file with the same name exists
+        logger.exception(err)
+        dir_name = os.path.basename(os.path.normpath(dir_path))
+        print('Error: A file with name \'' + dir_name + '\' exists.')
+        print('Could not create ' + dir_name + ' directory.')
+        exit(3)
+    except OSError as err:
+        logger.exception(err)
+        print(str(err))
+        exit(3)
+
+def get_max_wait(configs):
+    # Max seconds to wait for slow page transitions (e.g. workload creation)
+    max_wait = configs['GENERAL'].get('maxwait', '').strip()
+    if '' == max_wait:
+        max_wait = configs['DEFAULTS']['maxwait']
+    return int(max_wait)
 
 def get_input_data(input_file_path, script_dir):
-    # Specify default value for outDir parameter for the case it is missing in the input file.
+    # Specify default values for outDir and maxWait parameters for the case they are missing in the input file.
     # Get configurations from the input file (ini).
     try:
         configs = configparser.ConfigParser()
         configs.add_section('DEFAULTS')
         configs.set('DEFAULTS', 'outDir', script_dir)
+        configs.set('DEFAULTS', 'maxWait', '60')
         configs.read(input_file_path)
+        sections = configs.sections()
+        sections_set = set(sections)
         mandatory_sections = ['GENERAL', 'WAR']
-        for section in mandatory_sections:
-            if not configs.has_section(section):
+        missing_sections = [section for section in mandatory_sections if section not in sections_set]
+        if missing_sections:
+            for section in missing_sections:
                 print('Section \'' + section + '\' is missing in the input file')
-                exit(4)
+            exit(4)
         if '' == configs.get('GENERAL', 'signin.url'):
             print('Missing value for "signin.url" parameter in the configuration file')
             exit(4)
+        try:
+            if 0 >= get_max_wait(configs):
+                raise ValueError('maxWait should be positive')
+        except ValueError as err:
+            logger.exception(err)
+            print('Invalid value for "maxWait" parameter in the configuration file')
+            print('Expected: number of seconds')
+            exit(4)
         war_mandatory_keys = ['name', 'description', 'industryType', 'industry', 'environment', 
                               'regions', 'accountIDs', 'milestone']
-        for key in war_mandatory_keys:
-            if not configs.has_option('WAR', key):
+        # Option names are stored in the form returned by optionxform() (lowercase by default)
+        war_options = set(configs.options('WAR'))
+        missing_keys = [key for key in war_mandatory_keys if configs.optionxform(key) not in war_options]
+        if missing_keys:
+            for key in missing_keys:
                 print('Parameter \'' + key + '\' is missing in the input file')
-                exit(4)
-            elif '' == configs.get('WAR', key) and 'accountIDs' != key:
+            exit(4)
+        for key in war_mandatory_keys:
+            if '' == configs.get('WAR', key) and 'accountIDs' != key:
                 print('Missing value for "' + key +'" parameter in the configuration file')
                 exit(4)
-        has_question_section = False
-        sections = configs.sections()
-        for section in sections:
-            if section.startswith('QUESTION'):
-                has_question_section = True
-                keys = configs.options(section)
-                for key in keys:
-                    if key not in ['donotapply', 'notes'] and not key.isdigit():
-                        if args.debug:
-                            logging.error('Expected: number (answer index), Got: ' + key)
-                        print('Invalid answer numbering in the input file \'' + section + '\' section')
-                        print('Expected: number\nGot: ' + key)
-                        exit(4)
-                    if 'notes' != key:
-                        try:
-                            configs.getboolean(section, key)
-                        except ValueError as err:
-                            if args.debug:
-                                logging.exception(err)
-                            print('Invalid value for checkbox state in the input file \'' + section + '\' section')
-                            print('Expected boolean value (e.g. yes/no): Checkbox #' + key)
-                            exit(4)
-        if not has_question_section:
+        question_sections = [section for section in sections if section.startswith('QUESTION')]
+        if not question_sections:
             print('No section with \'QUESTION\' prefix in the input file')
             exit(4)
+        for section in question_sections:
+            keys = configs.options(section)
+            for key in keys:
+                if key not in ['donotapply', 'notes'] and not key.isdigit():
+                    logger.error('Expected: number (answer index), Got: ' + key)
+                    print('Invalid answer numbering in the input file \'' + section + '\' section')
+                    print('Expected: number\nGot: ' + key)
+                    exit(4)
+                if 'notes' != key:
+                    try:
+                        configs.getboolean(section, key)
+                    except ValueError as err:
+                        logger.exception(err)
+                        print('Invalid value for checkbox state in the input file \'' + section + '\' section')
+                        print('Expected boolean value (e.g. yes/no): Checkbox #' + key)
+                        exit(4)
         if not sections[-1].startswith('QUESTION'):
             print('The input file last section should be \'QUESTION\' section')
             exit(4)
-        return configs
+        # Materialize the sections into plain dictionaries (option names are lowercase),
+        # so the values are not looked up and interpolated by the parser on every access
+        return dict((section, dict(configs.items(section))) for section in sections)
     except configparser.Error as err:
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
         print(str(err))
         exit(4)
 
+def to_boolean(value):
+    # Same conversion as ConfigParser.getboolean() for the values already validated in get_input_data()
+    return configparser.ConfigParser.BOOLEAN_STATES[value.strip().lower()]
+
 def request_data(prompt, input_mask = True, mandatory = True):
     prompt += ': '
     if input_mask:
         answer = getpass.getpass(prompt)
     else:
-        if 3 <= get_python_version():
-            answer = input(prompt)
-        else:
-            answer = str(raw_input(prompt))
+        answer = input(prompt)
     if 0 == len(answer.strip()) and mandatory:
         print(prompt[:-2] + ' is not specified, exiting.')
         exit(0)
     return answer
 
-def open_browser():
+def set_download_directory(driver, output_dir):
+    driver.execute_cdp_cmd('Page.setDownloadBehavior', {'behavior': 'allow', 'downloadPath': output_dir})
+
+def block_tracker_urls(driver):
+    # Analytics and ad requests of the console pages are not needed for the automation.
+    # Failing to block them only affects the speed, so the error is logged and ignored.
+    blocked_urls = ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', 
+                    '*facebook.net*', '*bat.bing.com*', '*adsrvr.org*', '*demdex.net*']
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+    except Exception as err:
+        logger.exception(err)
+
+def quit_browser(driver):
+    print('Closing the browser')
+    try:
+        driver.quit()
+    except Exception as err:
+        logger.exception(err)
+
+def open_browser(output_dir):
     chrome_options = webdriver.ChromeOptions()
     if args.headless:
         chrome_options.add_argument('headless')
     chrome_options.add_argument('start-maximized')
+    if args.profile_dir is not None:
+        chrome_options.add_argument('user-data-dir=' + os.path.abspath(args.profile_dir))
+        chrome_options.add_argument('profile-directory=Default')
+    else:
+        # Keep only the HTTP cache between runs, so the console scripts are not downloaded again
+        # while the cookies and the session still start fresh in a temporary profile
+        script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+        chrome_options.add_argument('disk-cache-dir=' + os.path.join(script_dir, '.chrome_cache'))
+    # Images, notifications and the background services are not needed for the automation.
+    # Images are still allowed on the sign-in pages as they may show a CAPTCHA.
+    chrome_options.add_experimental_option('prefs', {
+        'profile.default_content_setting_values.images': 2,
+        'profile.content_settings.exceptions.images': {'[*.]signin.aws.amazon.com,*': {'setting': 1}},
+        'profile.default_content_setting_values.notifications': 2,
+        # Save the PDF file directly into the output directory
+        'download.default_directory': output_dir,
+        'download.prompt_for_download': False,
+        'safebrowsing.enabled': True,
+    })
+    for argument in ['disable-gpu', 'disable-extensions', 'disable-dev-shm-usage', 'disable-background-networking', 
+                     'disable-translate', 'disable-sync', 'disable-logging', 'log-level=3']:
+        chrome_options.add_argument(argument)
+    # Return from navigation as soon as DOM is ready, the elements are waited for explicitly
+    chrome_options.set_capability('pageLoadStrategy', 'eager')
     try:
         driver = webdriver.Chrome(options = chrome_options)
     except Exception as err:
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
         print(str(err))
         exit(3)
+    # Allow asynchronous scripts (e.g. dropdown item selection) to poll the page
+    driver.set_script_timeout(30)
+    block_tracker_urls(driver)
+    if args.headless:
+        # The download directory preference is ignored in headless mode
+        set_download_directory(driver, output_dir)
     if args.debug:
-        browser_version = driver.capabilities['version']
-        info_str = 'Chrome Browser Version: ' + browser_version
-        print(info_str)
-        logging.info(info_str)
-    if args.debug:
-        driver_version = driver.capabilities['chrome']['chromedriverVersion'].split()[0]
-        info_str = 'Chrome Driver Version: ' + driver_version
-        print(info_str)
-        logging.info(info_str)
+        # W3C capabilities (Selenium 4) name the browser version 'browserVersion', the legacy ones 'version'
+        browser_version = driver.capabilities.get('browserVersion', driver.capabilities.get('version'))
+        logger.info('Chrome Browser Version: ' + str(browser_version))
+        logger.info('Chrome Driver Version: ' + driver.capabilities['chrome']['chromedriverVersion'].split()[0])
     return driver
 
 def open_url(driver, configs):
     try:
-        signin_url = configs.get('GENERAL', 'signin.url')
+        signin_url = configs['GENERAL']['signin.url']
         if args.debug or args.headless:
             print('Opening URL: \'' + signin_url + '\'')
         driver.get(signin_url)
     except Exception as err:
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
         print(str(err))
         exit(6)
 
+def retrying(action, retries = 3):
+    # Call the action again when the page is re-rendered, e.g. an element goes stale
+    # between locating and using it. The action should locate its elements itself,
+    # so they are located again on the next attempt.
+    for attempt in range(1, retries + 1):
+        try:
+            return action()
+        except StaleElementReferenceException as err:
+            if retries == attempt:
+                raise
+            logger.warning('Retrying (' + str(attempt) + '/' + str(retries - 1) + '): ' + repr(err))
+            time.sleep(0.5 * attempt)
+
+def create_wait(driver, max_wait):
+    # Poll more often than the default 0.5 seconds, finding an element is cheap and it usually appears quickly.
+    # Elements replaced by the page while polling are looked up again on the next poll.
+    return WebDriverWait(driver, max_wait, poll_frequency = 0.1,
+                         ignored_exceptions = (NoSuchElementException, StaleElementReferenceException))
+
 def get_element(driver, locator, by_state, max_wait = 20):
     try:
-        if 'presence' == by_state:
-            element = WebDriverWait(driver, max_wait).until(EC.presence_of_element_located(locator))
-        elif 'visibility' == by_state:
-            element = WebDriverWait(driver, max_wait).until(EC.visibility_of_element_located(locator)) 
-        elif 'clickable' == by_state:
-            element = WebDriverWait(driver, max_wait).until(EC.element_to_be_clickable(locator))
-        elif 'invisibility' == by_state:
-            element = WebDriverWait(driver, max_wait).until(EC.invisibility_of_element_located(locator))
+        element = create_wait(driver, max_wait).until(element_conditions[by_state](locator))
     except Exception as err:
         print('The element \'' + locator[1] + '\' is not found or it is in inaccessible state.\n')
+        logger.exception(err)
         if args.debug:
-            logging.exception(err)
             print('Check log for more info.')
         exit(6)
     return element
 
 def get_elements(driver, locator, by_state, max_wait = 20):
     try:
-        if 'presence' == by_state:
-            elements = WebDriverWait(driver, max_wait).until(
-                                     EC.presence_of_all_elements_located(locator))
-        elif 'visibility' == by_state:
-            elements = WebDriverWait(driver, max_wait).until(
-                                     EC.visibility_of_all_elements_located(locator))
+        elements = create_wait(driver, max_wait).until(elements_conditions[by_state](locator))
     except Exception as err:
         print('The elements \'' + locator[1] + '\' are not found or they are in inaccessible state.\n')
+        logger.exception(err)
         if args.debug:
-            logging.exception(err)
             print('Check log for more info.')
         exit(6)
     return elements
 
+def click_element(driver, locator, by_state = 'clickable', max_wait = 20):
+    retrying(lambda: get_element(driver, locator, by_state, max_wait).click())
+
+def send_keys_to_element(driver, locator, keys, by_state = 'clickable', max_wait = 20):
+    retrying(lambda: get_element(driver, locator, by_state, max_wait).send_keys(keys))
+
+def get_element_text(driver, locator, by_state = 'visibility', max_wait = 20):
+    return str(retrying(lambda: get_element(driver, locator, by_state, max_wait).text))
+
+# Page script function setting the value of an input/textarea field instead of typing it key by key.
+# The native setter and the input/change events make page scripts (e.g. React) see the value as typed.
+set_value_script = 'function setValue(field, value) {' + \
+                   '    Object.getOwnPropertyDescriptor(Object.getPrototypeOf(field), "value").set.call(field, value);' + \
+                   '    field.dispatchEvent(new Event("input", {bubbles: true}));' + \
+                   '    field.dispatchEvent(new Event("change", {bubbles: true}));' + \
+                   '}'
+
+def set_field_value(driver, locator, value, by_state = 'clickable', max_wait = 20):
+    script = set_value_script + 'setValue(arguments[0], arguments[1]);'
+    retrying(lambda: driver.execute_script(script, get_element(driver, locator, by_state, max_wait), value))
+
 def enter_string(field, str_to_type, delay = False):
-    if args.debug:
-        logging.disable(logging.DEBUG)
     if delay:
-        for char in str_to_type:
-            field.send_keys(char)
-            time.sleep(random.random())
+        # Type in short chunks with small random pauses, all sent to the driver as a single action sequence
+        chunk_size = 5
+        actions = ActionChains(field.parent)
+        actions.click(field)
+        for index in range(0, len(str_to_type), chunk_size):
+            actions.send_keys(str_to_type[index:index + chunk_size])
+            actions.pause(random.uniform(0, 0.1))
+        actions.perform()
     else:
         field.send_keys(str_to_type)
-    if args.debug:
-        logging.disable(logging.NOTSET)
+
+def is_signin_page(driver):
+    return driver.title.endswith('Sign-In') or driver.title.endswith('Authentication')
+
+def is_element_displayed(driver, locator):
+    elements = driver.find_elements(*locator)
+    return 0 < len(elements) and elements[0].is_displayed()
+
+def has_signin_error(driver):
+    # The error container may be in the page markup before any error, only a displayed one counts
+    return is_element_displayed(driver, (By.CLASS_NAME, 'mainError'))
+
+def submit_credentials(driver, element_ids, username, password):
+    # Fill in the username and password fields and click the sign-in button in a single call
+    script = set_value_script + \
+             'setValue(document.getElementById(arguments[0]), arguments[3]);' + \
+             'setValue(document.getElementById(arguments[1]), arguments[4]);' + \
+             'document.getElementById(arguments[2]).click();'
+    driver.execute_script(script, element_ids[0], element_ids[1], element_ids[2], username, password)
 
 def login(driver, configs, username, password):
+    # WebDriver commands are logged with their payload on debug level, keep the credentials out of the log
+    remote_connection_logger = logging.getLogger('selenium.webdriver.remote.remote_connection')
+    remote_connection_level = remote_connection_logger.level
+    remote_connection_logger.setLevel(logging.INFO)
     try:
-        delay = False
-        if args.run_slowly:
-            delay = True
-        if args.debug:
-            logging.disable(logging.DEBUG)
-        signin_url = configs.get('GENERAL', 'signin.url')
+        signin_url = configs['GENERAL']['signin.url']
         ids_dict = {'AWS' : ['username', 'password', 'signin_button'],
                     'nClouds' : ['wdc_username', 'wdc_password', 'wdc_login_button']}
         #if -1 != signin_url.find('nclouds'):
@@ -299,93 +432,136 @@ def login(driver, configs, username, password):
         #else:
             #site_name = 'AWS'
         site_name = 'AWS'
+        if args.profile_dir is not None:
+            # The session kept in the profile may still be valid and the console opens without sign-in
+            WebDriverWait(driver, 20, poll_frequency = 0.25,
+                          ignored_exceptions = (StaleElementReferenceException,)).until(
+                lambda d: is_element_displayed(d, (By.ID, ids_dict[site_name][0])) or 
+                          is_element_displayed(d, (By.ID, 'nav-usernameMenu')))
+            if is_element_displayed(driver, (By.ID, 'nav-usernameMenu')):
+                info_str = 'Already logged in'
+                logger.debug(info_str)
+                print(info_str)
+                return
         username_field = get_element(driver, (By.ID, ids_dict[site_name][0]), 'clickable')
-        enter_string(username_field, username, delay)
-        passwd_field = get_element(driver, (By.ID, ids_dict[site_name][1]), 'clickable')
-        enter_string(passwd_field, password, delay)
-        signin_button = get_element(driver, (By.ID, ids_dict[site_name][2]), 'clickable')
-        signin_button.click()
-        while driver.title.endswith('Sign-In') or driver.title.endswith('Authentication'):
-            time.sleep(2)
-            if args.headless:
-                time.sleep(2)
-                if 'Amazon Web Services Sign-In' == driver.title:
-                    try:
-                        # Notify and exit when the entered username and/or password is not correct 
-                        element = driver.find_element_by_class_name('mainError')
-                        print(str(element.text))
-                        request_data('Press Enter key to exit', input_mask = False, mandatory = False)
-                        driver.quit()
-                        exit(6)
-                    except NoSuchElementException:
-                        pass
-                    try:
-                        mfacode_field = get_element(driver, (By.ID, 'mfacode'), 'visibility')
-                        answer = request_data('MFA Code')
-                        mfacode_field.send_keys(answer)
-                        submitMfa_button = get_element(driver, (By.ID, 'submitMfa_button'), 'clickable')
-                        submitMfa_button.click()
-                    except TimeoutException as err:
-                        if args.debug:
-                            logging.exception(err)
-                        print(str(err))
-                        exit(5)
+        if args.run_slowly:
+            enter_string(username_field, username, delay = True)
+            passwd_field = get_element(driver, (By.ID, ids_dict[site_name][1]), 'clickable')
+            enter_string(passwd_field, password, delay = True)
+            click_element(driver, (By.ID, ids_dict[site_name][2]))
+        else:
+            submit_credentials(driver, ids_dict[site_name], username, password)
+        while is_signin_page(driver):
+            if not args.headless:
+                # Wait until the user completes the sign-in (e.g. MFA code) in the browser window
+                try:
+                    WebDriverWait(driver, 600, poll_frequency = 0.25).until_not(is_signin_page)
+                except TimeoutException as err:
+                    logger.exception(err)
+                    print('The sign-in was not completed in the browser window in 10 minutes.')
+                    exit(5)
+                break
+            # Wait until the page leaves sign-in, reports an error or asks for MFA code
+            WebDriverWait(driver, 20, poll_frequency = 0.25,
+                          ignored_exceptions = (StaleElementReferenceException,)).until(
+                lambda d: not is_signin_page(d) or has_signin_error(d) or is_element_displayed(d, (By.ID, 'mfacode')))
+            if not is_signin_page(driver):
+                break
+            if has_signin_error(driver):
+                # Notify and exit when the entered username and/or password is not correct 
+                element = driver.find_element(By.CLASS_NAME, 'mainError')
+                print(str(element.text))
+                request_data('Press Enter key to exit', input_mask = False, mandatory = False)
+                exit(6)
+            mfacode_field = driver.find_element(By.ID, 'mfacode')
+            answer = request_data('MFA Code')
+            mfacode_field.send_keys(answer)
+            click_element(driver, (By.ID, 'submitMfa_button'))
+            # Wait until the MFA code is accepted or rejected
+            try:
+                WebDriverWait(driver, 20, poll_frequency = 0.25).until(
+                    lambda d: has_signin_error(d) or EC.invisibility_of_element(mfacode_field)(d))
+            except TimeoutException as err:
+                logger.exception(err)
+                print('MFA code verification did not finish in 20 seconds.')
+                exit(5)
         info_str = 'Logged in'
-        if args.debug:
-            logging.disable(logging.NOTSET)
-            logging.info(info_str)
+        logger.debug(info_str)
         print(info_str)
     except Exception as err:
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
         print(str(err))
         exit(5)
+    finally:
+        remote_connection_logger.setLevel(remote_connection_level)
 
 def select_region(driver, region):
+    # Read the current region from the page script first, there is nothing to wait for when it already matches
+    current_region = driver.execute_script('var menu = document.getElementById("nav-regionMenu");' + \
+                                           'return menu ? menu.innerText : null;')
+    if current_region is not None and region == current_region.strip():
+        return
     nav_regionMenu = get_element(driver, (By.ID, 'nav-regionMenu'), 'clickable')
     if region != str(nav_regionMenu.text).strip():
         nav_regionMenu.click()
-        region_link = get_element(driver, (By.PARTIAL_LINK_TEXT, region), 'clickable')
-        region_link.click()
+        click_element(driver, (By.PARTIAL_LINK_TEXT, region))
 
 def open_war_service(driver):
     service_name = 'AWS Well-Architected Tool'
-    service_search_field = get_element(driver, (By.ID, 'search-box-input'), 'clickable')
-    service_search_field.send_keys(service_name)
-    service_search_field.send_keys(Keys.ENTER)
+    send_keys_to_element(driver, (By.ID, 'search-box-input'), service_name + Keys.ENTER)
+
+def select_dropdown_items(driver, combobox_locator, item_selectors, max_wait = 20):
+    # Open the dropdown once and click the first visible item matching each CSS selector in a single call.
+    # The items are polled for inside the browser as the dropdown list is rendered asynchronously.
+    # The script returns the index of the selector whose item was not found or -1 on success.
+    script = 'var combobox = arguments[0], selectors = arguments[1], callback = arguments[arguments.length - 1];' + \
+             'var deadline = Date.now() + arguments[2] * 1000;' + \
+             'combobox.click();' + \
+             '(function pick(index) {' + \
+             '    if (index == selectors.length) { callback(-1); return; }' + \
+             '    var item = Array.prototype.find.call(document.querySelectorAll(selectors[index]), ' + \
+             '                                         function(el) { return 0 < el.getClientRects().length; });' + \
+             '    if (item) { item.click(); setTimeout(function() { pick(index + 1); }, 0); }' + \
+             '    else if (Date.now() > deadline) { callback(index); }' + \
+             '    else { setTimeout(function() { pick(index); }, 100); }' + \
+             '})(0);'
+    try:
+        failed_index = retrying(lambda: driver.execute_async_script(
+            script, get_element(driver, combobox_locator, 'clickable'), item_selectors, max_wait))
+    except Exception as err:
+        # The dropdown could not be used at all (e.g. a script error or timeout), no item lookup failed
+        logger.exception(err)
+        print('Failed to select items of the dropdown \'' + combobox_locator[1] + '\':\n' + str(err))
+        exit(6)
+    if -1 != failed_index:
+        print('The element \'' + item_selectors[failed_index] + '\' is not found or it is in inaccessible state.\n')
+        if args.debug:
+            print('Check log for more info.')
+        exit(6)
 
 def create_workload(driver, configs):
     #  Define workload - Workload properties input
-    define_workload_button = get_element(driver, (By.LINK_TEXT, 'Define workload'), 'clickable')
-    define_workload_button.click()
-    workload_name = configs.get('WAR', 'name')
-    name_field = get_element(driver, (By.XPATH, '//input[@name="name"]'), 'clickable')
-    name_field.send_keys(workload_name)
-    workload_desc = configs.get('WAR', 'description')
-    desc_field = get_element(driver, (By.XPATH, '//textarea[@name="description"]'), 'clickable')
-    desc_field.send_keys(workload_desc)
-
-    industry_type_combobox = get_element(driver, (By.NAME, 'industryGroup'), 'clickable')
-    industry_type_combobox.click()
-    industry_type = configs.get('WAR', 'industryType')
+    click_element(driver, (By.LINK_TEXT, 'Define workload'))
+    workload_name = configs['WAR']['name']
+    set_field_value(driver, (By.CSS_SELECTOR, 'input[name="name"]'), workload_name)
+    workload_desc = configs['WAR']['description']
+    set_field_value(driver, (By.CSS_SELECTOR, 'textarea[name="description"]'), workload_desc)
+
+    industry_type = configs['WAR']['industrytype']
     # Change the value to match item id naming convention
     #industry_type = industry_type.replace('& ', '')
     #industry_type = industry_type.replace(' ', '_')
     #industry_type_item = get_element(driver, (By.XPATH, '//li[contains(@id, "' + industry_type + '")]'), 'clickable')
-    industry_type_item = get_element(driver, (By.XPATH, '//div[contains(@title, "' + industry_type + '")]'), 'clickable')
-    industry_type_item.click()
+    select_dropdown_items(driver, (By.NAME, 'industryGroup'), ['div[title*="' + industry_type + '"]'])
 
-    industry_name_combobox = get_element(driver, (By.ID, 'subIndustrySelect'), 'clickable')
-    industry_name_combobox.click()
-    industry_name = configs.get('WAR', 'industry')
+    industry_name = configs['WAR']['industry']
     # Change the value to match item id naming convention
     #industry_name = industry_name.replace('& ', '')
     #industry_name = industry_name.replace(' ', '_')
     #industry_name_item = get_element(driver, (By.XPATH, '//li[contains(@id, "' + industry_name + '")]'), 'clickable')
-    industry_name_item = get_element(driver, (By.XPATH, '//div[contains(@title, "' + industry_name + '")]'), 'clickable')
-    industry_name_item.click()
+    select_dropdown_items(driver, (By.ID, 'subIndustrySelect'), ['div[title*="' + industry_name + '"]'])
 
-    environment = configs.get('WAR', 'environment').lower()
+    environment = configs['WAR']['environment'].lower()
     if environment.startswith('prod'):
         radio_button_value = 'prod'
     elif environment.startswith('pre-prod'):
@@ -402,207 +578,191 @@ def create_workload(driver, configs):
             print('Invalid input')
             logout(driver)
             exit(4)
-    environment_radio_button = get_element(driver, (By.XPATH, '//input[@type="radio" and @value="' + \
-                                                    radio_button_value + '"]'), 'presence')
-    actions = ActionChains(driver)
-    actions.move_to_element(environment_radio_button)
-    actions.click(environment_radio_button)
-    actions.perform()
-
-    aws_regions_checkbox = get_element(driver, (By.XPATH, '//*[@id="workloadRegionsCheckbox"]//input[@type="checkbox"]'), 
-                                                'presence')
-    aws_regions_checkbox.click()
-    regions = configs.get('WAR', 'regions').lower().split(',')
-    for region in regions:
-        aws_regions_combobox = get_element(driver, (By.XPATH, '//div[contains(@placeholder, "Choose regions")]'), 'clickable')
-        aws_regions_combobox.click()
-        #regions_item = get_element(driver, (By.XPATH, '//li[contains(@id, "' + region + '")]'), 'clickable')
-        regions_item = get_element(driver, (By.XPATH, '//div[contains(@data-value, "' + region + '")]'), 'clickable')
-        regions_item.click()
-        time.sleep(2)
-        aws_regions_combobox.click()
-    skip_ids = False
-    account_ids = configs.get('WAR', 'accountIDs')
-    if '' != account_ids:
-        for account_id in account_ids.split(','):
-            account_id = account_id.strip()
-            if 12 != len(account_id) or not account_id.isdigit():
-                print('Invalid Account ID in the input file: ' + account_id)
-                answer = request_data('Do you want to continue without entering Account IDs? (y/n)', input_mask = False)
-                if not answer.lower().startswith('y'):
-                    logout(driver)
-                    print('The script exited')
-                    exit(4)
-                else:
-                    skip_ids = True
-                    break
-    else:
-        skip_ids = True
-    if not skip_ids:
-        account_ids_textarea = get_element(driver, (By.ID, 'awsui-textarea-2'), 'clickable')
-        account_ids_textarea.send_keys(account_ids)
-    define_workload_button = get_element(driver, (By.ID, 'defineWorkload-createWorkloadButton'), 'clickable')
-    define_workload_button.click()
-
-def check_loading_state(driver, question_text):
-    # Wait until the next question will be loaded
+    environment_radio_button_locator = (By.CSS_SELECTOR, 'input[type="radio"][value="' + radio_button_value + '"]')
+    # Click from the page script, no pointer move/down/up events are needed for the radio button
+    retrying(lambda: driver.execute_script('arguments[0].scrollIntoView({block: "center"}); arguments[0].click();', 
+                                           get_element(driver, environment_radio_button_locator, 'presence')))
+
+    click_element(driver, (By.CSS_SELECTOR, '#workloadRegionsCheckbox input[type="checkbox"]'), 'presence')
+    regions = configs['WAR']['regions'].lower().split(',')
+    aws_regions_combobox_locator = (By.CSS_SELECTOR, 'div[placeholder*="Choose regions"]')
+    #regions_item = get_element(driver, (By.XPATH, '//li[contains(@id, "' + region + '")]'), 'clickable')
+    # Select all the regions in a single dropdown opening and close it afterwards
+    select_dropdown_items(driver, aws_regions_combobox_locator, ['div[data-value*="' + region + '"]' for region in regions])
+    click_element(driver, aws_regions_combobox_locator)
+    account_ids = [account_id.strip() for account_id in configs['WAR']['accountids'].split(',') 
+                   if '' != account_id.strip()]
+    invalid_ids = [account_id for account_id in account_ids if 12 != len(account_id) or not account_id.isdigit()]
+    if 0 < len(invalid_ids):
+        print('Invalid Account IDs in the input file: ' + ', '.join(invalid_ids))
+        answer = request_data('Do you want to continue without entering Account IDs? (y/n)', input_mask = False)
+        if not answer.lower().startswith('y'):
+            logout(driver)
+            print('The script exited')
+            exit(4)
+    elif 0 < len(account_ids):
+        set_field_value(driver, (By.ID, 'awsui-textarea-2'), ','.join(account_ids))
+    click_element(driver, (By.ID, 'defineWorkload-createWorkloadButton'))
+    # Wait until the workload is created and its page is shown
+    get_element(driver, (By.LINK_TEXT, 'Start review'), 'visibility', max_wait = get_max_wait(configs))
+
+def check_loading_state(driver, question_title, question_text):
+    # Wait until the next question will be loaded.
+    # The title element of the previous question is checked while it is attached to the page,
+    # it is located again only when the page has replaced it.
+    def is_question_changed(d):
+        try:
+            return question_text != str(question_title.text)
+        except StaleElementReferenceException:
+            return question_text != str(d.find_element(By.CLASS_NAME, 'awsui-util-action-stripe-title').text)
     try:
-        max_wait = 60
-        while question_text == str(WebDriverWait(driver, 10).until(EC.visibility_of_element_located((By.CLASS_NAME, 
-                                                                   'awsui-util-action-stripe-title'))).text):
-            time.sleep(1.5)
-            max_wait -= 1.5
-            if 0 >= max_wait:
-                print('The page loading did not finish in more than 1 minute.')
-                logout(driver)
-                exit(6)
+        WebDriverWait(driver, 60, poll_frequency = 0.25, 
+                      ignored_exceptions = (NoSuchElementException, StaleElementReferenceException)).until(
+            is_question_changed)
     except TimeoutException as err:
-        if args.debug:
-            logging.exception(err)
-        print('The question text at the top of the page was not found.')
+        logger.exception(err)
+        print('The page loading did not finish in more than 1 minute.')
         logout(driver)
         exit(6)
 
 def save_milestone_and_pdf(driver, configs):
-    milestone_name = configs.get('WAR', 'milestone')
-    save_milestone_button = get_element(driver, (By.ID, 'viewWorkload-recordMilestone'), 'clickable')
-    save_milestone_button.click()
+    milestone_name = configs['WAR']['milestone']
+    click_element(driver, (By.ID, 'viewWorkload-recordMilestone'))
     # Wait until 'Save milestone' modal dialog appears
     get_element(driver, (By.CLASS_NAME, 'awsui-modal-container'), 'visibility')
-    milestone_name_inputbox = get_element(driver, (By.XPATH, '//input[@name="milestoneName"]'), 'clickable')
-    milestone_name_inputbox.send_keys(milestone_name)
-    save_button = get_element(driver, (By.ID, 'viewWorkloadRecordMilestoneRecordButton'), 'clickable')
-    save_button.click()
+    send_keys_to_element(driver, (By.CSS_SELECTOR, 'input[name="milestoneName"]'), milestone_name)
+    click_element(driver, (By.ID, 'viewWorkloadRecordMilestoneRecordButton'))
     # Wait until 'Save milestone' modal dialog disappears
     get_element(driver, (By.CLASS_NAME, 'awsui-modal-container'), 'invisibility')
-    generate_pdf_button = get_element(driver, (By.ID, 'viewWorkload_generatePDFButton'), 'clickable')
-    generate_pdf_button.click()
+    click_element(driver, (By.ID, 'viewWorkload_generatePDFButton'))
     # Wait until PDF file download finishes
-    generate_pdf_button = get_element(driver, (By.XPATH, '//*[@id="viewWorkload_generatePDFButton"]//button[@type="submit"]'),
+    generate_pdf_button = get_element(driver, (By.CSS_SELECTOR, '#viewWorkload_generatePDFButton button[type="submit"]'),
                                      'presence')
-    while not generate_pdf_button.is_enabled():
-        time.sleep(1)
-
-def move_PDF_file(driver, configs, output_dir):
-    import shutil
-    if 'nt' == os.name:
-        downloads_dir = os.path.join(os.environ['USERPROFILE'], 'Downloads')
-    else:
-        downloads_dir = os.path.join(os.environ['HOME'], 'Downloads')
-    workload_name = configs.get('WAR', 'name')
-    pdf_file_path = os.path.join(downloads_dir, workload_name + '.pdf')
-    max_wait = 15
-    while not os.path.isfile(pdf_file_path):
-        time.sleep(1)
-        max_wait -= 1
-        if 0 >= max_wait:
-            print('File "' + pdf_file_path + '" is not found')
-            logout(driver)
-            exit(6)
-    time.sleep(2)
     try:
-        shutil.move(pdf_file_path, output_dir)
-    except Exception as err:
-        if args.debug:
-            logging.exception(err)
-        print('Failed to move "' + pdf_file_path + '" file into "' + output_dir + '" directory')
-        return
-    print('File "' + pdf_file_path + '" is moved into "' + output_dir + '" directory')
+        WebDriverWait(driver, 60, poll_frequency = 0.2).until(lambda d: generate_pdf_button.is_enabled())
+    except TimeoutException as err:
+        logger.exception(err)
+        print('The PDF file generation did not finish in more than 1 minute.')
+        logout(driver)
+        exit(6)
+
+def wait_for_file(file_path, max_wait = 15, poll_frequency = 0.2):
+    # Wait until the file appears, it is not empty, Chrome has no partial download of it (.crdownload)
+    # and its size stops changing (the download is complete)
+    end_time = time.time() + max_wait
+    last_size = -1
+    while time.time() < end_time:
+        # A single stat call per poll both checks the existence and gets the size
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = -1
+        if 0 < size and size == last_size and not os.path.exists(file_path + '.crdownload'):
+            return True
+        last_size = size
+        time.sleep(poll_frequency)
+    return False
+
+def check_PDF_file(configs, output_dir):
+    # Runs in a worker thread, so only the file system is accessed here.
+    # Returns False when the downloaded PDF file is not found.
+    workload_name = configs['WAR']['name']
+    pdf_file_path = os.path.join(output_dir, workload_name + '.pdf')
+    if not wait_for_file(pdf_file_path):
+        print('File "' + pdf_file_path + '" is not found')
+        return False
+    print('PDF file is saved: "' + pdf_file_path + '"')
+    return True
 
 def is_last_question(driver):
     try:
-        driver.find_element_by_xpath('//*[@id="questionWizard-saveAndExitButton-finalQuestion" and @class=""]')
+        driver.find_element(By.CSS_SELECTOR, '#questionWizard-saveAndExitButton-finalQuestion[class=""]')
         return True
     except NoSuchElementException:
         return False
 
 def review(driver, configs):
     ignore_answers_count_mismatch = False
-    start_review_button = get_element(driver, (By.LINK_TEXT, 'Start review'), 'clickable')
-    start_review_button.click()
-    sections = configs.sections()
-    sections_count = len(sections)
-    for section in sections:
-        if not section.startswith('QUESTION'):
-            continue
+    click_element(driver, (By.LINK_TEXT, 'Start review'))
+    question_sections = [section for section in configs if section.startswith('QUESTION')]
+    last_question_section = question_sections[-1]
+    for section in question_sections:
         # Get the question text to compare later for loading state checking
-        question_text = str(WebDriverWait(driver, 20).until(EC.visibility_of_element_located((By.CLASS_NAME, 
-                                                            'awsui-util-action-stripe-title'))).text)
+        question_title = get_element(driver, (By.CLASS_NAME, 'awsui-util-action-stripe-title'), 'visibility')
+        question_text = str(question_title.text)
+        logger.debug('Section Name: ' + section)
+        logger.debug('Question: ' + question_text)
         if args.debug or args.headless:
-            logging.info('Section Name: ' + section)
-            logging.info('Question: ' + question_text)
             print('\tSection Name: ' + section)
             print('Question: ' + question_text)
-        keys = configs.options(section) 
+        section_data = configs[section]
+        keys = list(section_data.keys())
         does_not_apply = False
         notes = ''
-        if configs.has_option(section, 'doNotApply'):
-            does_not_apply = configs.getboolean(section, 'doNotApply')
+        if 'donotapply' in section_data:
+            does_not_apply = to_boolean(section_data['donotapply'])
             keys.remove('donotapply')
-        if configs.has_option(section, 'notes'):
-            notes = configs.get(section, 'notes')
+        if 'notes' in section_data:
+            notes = section_data['notes']
             keys.remove('notes')
 
         # 'Question does not apply to this workload' toggle button
-        toggle_button = get_element(driver, (By.CSS_SELECTOR, '*[id^="awsui-toggle"]'), 
-                                    'clickable')
-        is_checked = False
-        if str(toggle_button.get_attribute('class')).endswith('checked'):
-            is_checked = True      
-        if does_not_apply != is_checked:
-            toggle_button.click()
+        # Read the toggle state and switch it if needed in a single call
+        retrying(lambda: driver.execute_script(
+            'var is_checked = String(arguments[0].getAttribute("class")).endsWith("checked");' + \
+            'if (arguments[1] != is_checked) { arguments[0].click(); }', 
+            get_element(driver, (By.CSS_SELECTOR, '*[id^="awsui-toggle"]'), 'clickable'), does_not_apply))
 
         # Answer notes field
         if 0 < len(notes):
-            notes_textarea = get_element(driver, (By.CSS_SELECTOR, 'textarea[id^="awsui-textarea"][name="answerNotes"]'), 
-                                         'clickable')
-            notes_textarea.send_keys(notes)
+            send_keys_to_element(driver, (By.CSS_SELECTOR, 'textarea[id^="awsui-textarea"][name="answerNotes"]'), 
+                                 notes)
         if not does_not_apply:
             # Questions section automation
-            question_checkboxes = get_elements(driver, (By.CSS_SELECTOR, 'input[id^="awsui-checkbox"]'), 'presence')
-            for key in keys:
-                if configs.getboolean(section, key):
-                    try:
-                        checkbox = question_checkboxes[int(key) - 1]
-                        checkbox.click()
-                    except IndexError as err:
-                        if args.debug:
-                            logging.exception(err)
-                        if not ignore_answers_count_mismatch:
-                            print('Answers count mismatch for question \'' + section + '\'')
-                            print('Expected (in input file): ' + str(len(keys)))
-                            print('Actual: ' + str(len(question_checkboxes)))
-                            answer = request_data('Do you want to continue and ignore all such mismatches? (y/n)', 
-                                                  input_mask = False)
-                            if answer.lower().startswith('y'):
-                                ignore_answers_count_mismatch = True
-                                break
-                            else:
-                                logout(driver)
-                                print('The script exited')
-                                exit(4)
+            checkbox_indexes = [int(key) - 1 for key in keys if to_boolean(section_data[key])]
+            def click_answers():
+                # Click all the selected answers in a single call, returns the number of the answers
+                question_checkboxes = get_elements(driver, (By.CSS_SELECTOR, 'input[id^="awsui-checkbox"]'), 
+                                                   'presence')
+                driver.execute_script('var checkboxes = arguments[0];' + \
+                                      'arguments[1].forEach(function(index) { checkboxes[index].click(); });', 
+                                      question_checkboxes, 
+                                      [index for index in checkbox_indexes if 0 <= index < len(question_checkboxes)])
+                return len(question_checkboxes)
+            checkboxes_count = retrying(click_answers)
+            missing_indexes = [index for index in checkbox_indexes if not 0 <= index < checkboxes_count]
+            if 0 < len(missing_indexes) and not ignore_answers_count_mismatch:
+                logger.error('Answer index out of range: ' + str(missing_indexes[0] + 1))
+                print('Answers count mismatch for question \'' + section + '\'')
+                print('Expected (in input file): ' + str(len(keys)))
+                print('Actual: ' + str(checkboxes_count))
+                answer = request_data('Do you want to continue and ignore all such mismatches? (y/n)', 
+                                      input_mask = False)
+                if answer.lower().startswith('y'):
+                    ignore_answers_count_mismatch = True
+                else:
+                    logout(driver)
+                    print('The script exited')
+                    exit(4)
         # Check if it is the last question and perform corresponding action
         is_last = is_last_question(driver)
-        if is_last and (section != sections[-1]):
+        if is_last and (section != last_question_section):
             print('The specified questions count in the configuration file exceeds the actual one')
             request_data('Press Enter key to exit', input_mask = False, mandatory = False)
             logout(driver)
             exit(6)
-        elif not is_last and (section == sections[-1]):
+        elif not is_last and (section == last_question_section):
             print('The specified questions count in the configuration file is less than the actual one')
             request_data('Press Enter key to exit', input_mask = False, mandatory = False)
             logout(driver)
             exit(6)
         else:
             if not is_last:
-                next_button = get_element(driver, (By.ID, 'questionWizard-nextQuestionButton'), 'clickable')
-                next_button.click()
-                check_loading_state(driver, question_text)
-        if args.run_slowly:
-            # Add some randomness
-            time.sleep(random.random())
-    save_and_exit_button = get_element(driver, (By.ID, 'questionWizard-saveAndExitButton-finalQuestion'), 'clickable')
-    save_and_exit_button.click()
+                click_element(driver, (By.ID, 'questionWizard-nextQuestionButton'))
+                check_loading_state(driver, question_title, question_text)
+    click_element(driver, (By.ID, 'questionWizard-saveAndExitButton-finalQuestion'))
+    # Wait until the answers are saved and the workload page is shown
+    get_element(driver, (By.ID, 'viewWorkload-recordMilestone'), 'clickable', max_wait = get_max_wait(configs))
     save_milestone_and_pdf(driver, configs)
 
 def create_file(file_path, data, mode = 'w'):
@@ -610,71 +770,76 @@ def create_file(file_path, data, mode = 'w'):
         with open(file_path, mode) as f:
             f.write(data)
     except Exception as err:
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
         print('Failed to create file:\n' + file_path)
 
 def save_ARN(driver, configs, output_dir):
-    milestones_link = get_element(driver, (By.LINK_TEXT, 'Milestones'), 'clickable')
-    milestones_link.click()
-    milestone_name = configs.get('WAR', 'milestone')
-    milestone_link = get_element(driver, (By.LINK_TEXT, milestone_name), 'clickable')
-    milestone_link.click()
-    properties_link = get_element(driver, (By.LINK_TEXT, 'Properties'), 'clickable')
-    properties_link.click()
-    ARN = str(get_element(driver, (By.ID, 'viewWorkload_workloadArn_milestone'), 'visibility').text)
-    workload_name = configs.get('WAR', 'name')
+    click_element(driver, (By.LINK_TEXT, 'Milestones'))
+    milestone_name = configs['WAR']['milestone']
+    click_element(driver, (By.LINK_TEXT, milestone_name))
+    click_element(driver, (By.LINK_TEXT, 'Properties'))
+    ARN = get_element_text(driver, (By.ID, 'viewWorkload_workloadArn_milestone'))
+    workload_name = configs['WAR']['name']
     ARN_file_path = os.path.join(output_dir, 'ARN-' + workload_name + '.txt')
     create_file(ARN_file_path, ARN)
     print('ARN is saved: "' + ARN_file_path + '"')
 
 def logout(driver):
-    print('Logging out')
-    username_menu = get_element(driver, (By.ID, 'nav-usernameMenu'), 'clickable')
-    username_menu.click()
-    logout_button = get_element(driver, (By.ID, 'aws-console-logout'), 'clickable')
-    logout_button.click()
-    print('Closing the browser')
-    driver.quit()
+    # Keep the session signed in when it is stored in a reused profile
+    if args.profile_dir is None:
+        print('Logging out')
+        click_element(driver, (By.ID, 'nav-usernameMenu'))
+        click_element(driver, (By.ID, 'aws-console-logout'))
 
 def run(username, password, configs, output_dir):
     try:
-        driver = open_browser()
+        driver = open_browser(output_dir)
+        # Close the browser when the script exits, also on the error exits
+        atexit.register(quit_browser, driver)
         open_url(driver, configs)
         login(driver, configs, username, password)
         select_region(driver, 'N. Virginia')
         open_war_service(driver)
         create_workload(driver, configs)
         review(driver, configs)
-        move_PDF_file(driver, configs, output_dir)
-        save_ARN(driver, configs, output_dir)
+        # Wait for the PDF file download on the file system while the ARN is read in the browser
+        with ThreadPoolExecutor(max_workers = 1) as executor:
+            pdf_future = executor.submit(check_PDF_file, configs, output_dir)
+            save_ARN(driver, configs, output_dir)
+            is_pdf_saved = pdf_future.result()
+        if not is_pdf_saved:
+            logout(driver)
+            exit(6)
         logout(driver)
     except Exception as err:
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
         print(str(err))
         exit(6)
 
 def setup_output_destination(configs, customer_name):
-    output_dir = configs.get('GENERAL', 'outDir')
+    output_dir = configs['GENERAL'].get('outdir', '')
     if '' == output_dir:
-        output_dir = configs.get('DEFAULTS', 'outDir')
+        output_dir = configs['DEFAULTS']['outdir']
     #if args.output_dir is not None:
         #output_dir = args.output_dir
     if not os.path.isabs(output_dir):
         output_dir = os.path.abspath(output_dir) 
-    workload_name = configs.get('WAR', 'name')
+    workload_name = configs['WAR']['name']
     customer_dir = os.path.join(output_dir, customer_name) 
     pdf_file_path = os.path.join(customer_dir, workload_name + '.pdf')
     if os.path.isfile(pdf_file_path):
         print('File "' + pdf_file_path + '" exists.')
-        answer = request_data('Do you want to overwrite? (y/n)', input_mask = False)
+        if args.overwrite:
+            answer = 'y'
+        elif args.skip_existing:
+            answer = 'n'
+        else:
+            answer = request_data('Do you want to overwrite? (y/n)', input_mask = False)
         if answer.lower().startswith('y'):
             try:
                 os.remove(pdf_file_path)
             except OSError as err:
-                if args.debug:
-                    logging.exception(err)
+                logger.exception(err)
                 print("Failed to remove the file:\n" + str(err))
                 print('The script exited')
                 exit(3)
@@ -688,11 +853,13 @@ def main():
     try:
         script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
         setup_input_args(script_dir)
+        logger.setLevel(logging.DEBUG if args.debug else logging.WARNING)
         if args.debug:
             log_dir = os.path.join(script_dir, 'log')
             make_directory(log_dir)
             log_file_path = os.path.join(log_dir, 'debug.log')
             logging_setup(log_file_path)
+        import_selenium()
         check_chrome_driver_existence()
         input_file_path = os.path.abspath(args.input_file_path)
         if not os.path.isfile(input_file_path):
@@ -701,21 +868,18 @@ def main():
         configs = get_input_data(input_file_path, script_dir)
         customer_name = request_data('Customer Name', input_mask = False)
         output_dir = setup_output_destination(configs, customer_name)
-        username = request_data('AWS Console Username')
-        password = request_data('AWS Console Password')
+        # The credentials can be provided through the environment for unattended runs
+        username = os.environ.get('WAR_USERNAME') or request_data('AWS Console Username')
+        password = os.environ.get('WAR_PASSWORD') or request_data('AWS Console Password')
         datetime_format = '%Y-%m-%d %H:%M:%S'
-        current_datetime = datetime.datetime.now()
-        print("Started: " + current_datetime.strftime(datetime_format))
+        print("Started: " + time.strftime(datetime_format))
         run(username, password, configs, output_dir)
-        current_datetime = datetime.datetime.now()
-        print("Ended: " + current_datetime.strftime(datetime_format))
+        print("Ended: " + time.strftime(datetime_format))
     except KeyboardInterrupt as err:
         print('\nScript execution interrupted by the user')
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
     except Exception as err:
         print('\n' + str(err))
-        if args.debug:
-            logging.exception(err)
+        logger.exception(err)
 
 main()
\ No newline at end of file